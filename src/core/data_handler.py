@@ -8,6 +8,12 @@ class DataHandler:
 
     def load_data(self, filepath):
         """Load data from a CSV file."""
+        data, metadata = self.read_csv(filepath)
+        self.set_data(data, metadata)
+        return data, metadata
+
+    def read_csv(self, filepath):
+        """Parse a CSV file without replacing the currently loaded data."""
         metadata = {}
         data_start = 0
         
@@ -31,9 +37,12 @@ class DataHandler:
         if missing_columns:
             raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
             
+        return data, metadata
+
+    def set_data(self, data, metadata):
+        """Make parsed data the currently loaded data."""
         self.data = data
         self.metadata = metadata
-        return data, metadata
 
     def get_measurements(self, channel):
         """Calculate measurements for a given channel."""
@@ -1,10 +1,70 @@
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
+@dataclass(frozen=True, slots=True)
+class UITheme:
+    """Resolved UI colors of a theme with all fallbacks applied."""
+    bg: str
+    fg: str
+    select_bg: str
+    frame_bg: str
+    accent: str
+    tree_bg: str
+    tree_fg: str
+    tree_select_bg: str
+    button_bg: str
+    button_fg: str
+    button_active_bg: str
+    button_active_fg: str
+    icon_fg: str
+    border: str
+    input_bg: str
+    input_fg: str
+    label_bg: str
+    label_fg: str
+    scrollbar_bg: str
+    scrollbar_fg: str
+    plot_bg: str
+
+    @classmethod
+    def from_dict(cls, ui):
+        """Build a UITheme from a theme's 'ui' section, resolving missing keys."""
+        bg = ui['bg']
+        fg = ui['fg']
+        select_bg = ui.get('select_bg', bg)
+        button_bg = ui.get('button_bg', bg)
+        button_fg = ui.get('button_fg', fg)
+        return cls(
+            bg=bg,
+            fg=fg,
+            select_bg=select_bg,
+            frame_bg=ui.get('frame_bg', bg),
+            accent=ui.get('accent', fg),
+            tree_bg=ui.get('tree_bg', bg),
+            tree_fg=ui.get('tree_fg', fg),
+            tree_select_bg=ui.get('tree_select_bg', select_bg),
+            button_bg=button_bg,
+            button_fg=button_fg,
+            button_active_bg=ui.get('button_active_bg', select_bg),
+            button_active_fg=ui.get('button_active_fg', button_fg),
+            icon_fg=ui.get('icon_fg', fg),
+            border=ui.get('border', select_bg),
+            input_bg=ui.get('input_bg', bg),
+            input_fg=ui.get('input_fg', fg),
+            label_bg=ui.get('label_bg', bg),
+            label_fg=ui.get('label_fg', fg),
+            scrollbar_bg=ui.get('scrollbar_bg', button_bg),
+            scrollbar_fg=ui.get('scrollbar_fg', fg),
+            plot_bg=ui.get('plot_bg', bg)
+        )
+
 class ThemeManager:
     def __init__(self):
         self.themes = {}
+        self.ui_themes = {}
+        self._theme_names = None  # Sorted theme names, computed on first use
         self.current_theme = None
         self.theme_dir = Path(__file__).parent / "definitions"
         self.theme_dir.mkdir(exist_ok=True)
@@ -12,11 +72,13 @@ class ThemeManager:
 
     def load_themes(self):
         """Load all theme definitions from the themes directory."""
+        self._theme_names = None
         for theme_file in self.theme_dir.glob("*.json"):
             try:
                 with open(theme_file, "r") as f:
                     theme_data = json.load(f)
                     self.themes[theme_data["name"]] = theme_data
+                    self.ui_themes[theme_data["name"]] = UITheme.from_dict(theme_data["ui"])
             except Exception as e:
                 print(f"Error loading theme {theme_file}: {e}")
 
@@ -25,13 +87,19 @@ class ThemeManager:
         return self.themes.get(theme_name)
 
     def get_theme_names(self):
-        """Get list of available theme names."""
-        return sorted(list(self.themes.keys()))
+        """Get a tuple of available theme names."""
+        if self._theme_names is None:
+            self._theme_names = tuple(sorted(self.themes))
+        return self._theme_names
 
     def get_current_theme(self):
         """Get the current theme data."""
         return self.themes.get(self.current_theme)
 
+    def get_current_ui_theme(self):
+        """Get the resolved UI colors of the current theme."""
+        return self.ui_themes.get(self.current_theme)
+
     def set_current_theme(self, theme_name):
         """Set the current theme."""
         if theme_name in self.themes:
@@ -49,4 +117,6 @@ class ThemeManager:
             json.dump(theme_data, f, indent=4)
         
         self.themes[theme_data["name"]] = theme_data
+        self.ui_themes[theme_data["name"]] = UITheme.from_dict(theme_data["ui"])
+        self._theme_names = None
         return theme_data 
\ No newline at end of file
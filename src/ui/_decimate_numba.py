@@ -0,0 +1,38 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except Exception:  # numba is optional, and a broken install must not break plotting; PlotManager falls back to NumPy
+    minmax_bins = None
+else:
+    @njit(cache=True, parallel=True)
+    def minmax_bins(y, edges, out_imin, out_imax):
+        """Write the index of the min and max sample of each bin between consecutive edges."""
+        for i in prange(len(edges) - 1):
+            lo = edges[i]
+            imin = lo
+            imax = lo
+            vmin = y[lo]
+            vmax = y[lo]
+            for j in range(lo + 1, edges[i + 1]):
+                v = y[j]
+                if v < vmin:
+                    vmin = v
+                    imin = j
+                elif v > vmax:
+                    vmax = v
+                    imax = j
+            out_imin[i] = imin
+            out_imax[i] = imax
+
+_warmed_up = False
+
+def warm_up():
+    """Compile minmax_bins for the array types _decimate passes; call it off the Tk thread."""
+    global _warmed_up
+    if minmax_bins is None or _warmed_up:
+        return
+    y = np.zeros(4, dtype=np.float32)
+    edges = np.array([0, 2, 4], dtype=np.int64)
+    minmax_bins(y, edges, np.empty(2, dtype=np.int64), np.empty(2, dtype=np.int64))
+    _warmed_up = True
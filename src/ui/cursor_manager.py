@@ -2,10 +2,8 @@ class CursorManager:
     def __init__(self, ax, viewer, theme_manager):
         self.ax = ax
         self.cursors = {
-            'time1': {'line': None, 'label': None, 'value': None, 'active': False},
-            'time2': {'line': None, 'label': None, 'value': None, 'active': False},
-            'volt1': {'line': None, 'label': None, 'value': None, 'active': False},
-            'volt2': {'line': None, 'label': None, 'value': None, 'active': False}
+            name: self._create_cursor(name)
+            for name in ('time1', 'time2', 'volt1', 'volt2')
         }
         self.dragging = False
         self.active_cursor = None
@@ -14,100 +12,118 @@ class CursorManager:
         self.current_theme = None
         self.viewer = viewer
         self.theme_manager = theme_manager
+        self._fallback_theme = None
+
+    def _create_cursor(self, name):
+        """Create the hidden line and label of a cursor; they are reused for every placement."""
+        if 'time' in name:
+            line = self.ax.axvline(0, linestyle='--', alpha=0.8, picker=True, label=name, visible=False)
+            label = self.ax.text(
+                0, 1,
+                name,
+                rotation=90,
+                va='top',
+                ha='right',
+                transform=self.ax.get_xaxis_transform(),
+                alpha=0.8,
+                visible=False
+            )
+        else:
+            line = self.ax.axhline(0, linestyle='--', alpha=0.8, picker=True, label=name, visible=False)
+            label = self.ax.text(
+                0, 0,
+                name,
+                va='bottom',
+                ha='left',
+                transform=self.ax.get_yaxis_transform(),
+                alpha=0.8,
+                visible=False
+            )
+        return {'line': line, 'label': label, 'value': None, 'active': False}
 
     def set_theme(self, theme):
         """Set the current theme."""
+        if theme is self.current_theme:
+            return
         self.current_theme = theme
+        for cursor in self.cursors.values():
+            cursor['label'].set_backgroundcolor(theme['bg'])
         self.update_cursor_positions()
 
     def _get_fallback_theme(self):
-        return self.theme_manager.get_theme("Gruvbox Dark")['plot']
+        if self._fallback_theme is None:
+            self._fallback_theme = self.theme_manager.get_theme("Gruvbox Dark")['plot']
+        return self._fallback_theme
+
+    def _update_label(self, name):
+        """Move a cursor label to the cursor value and refresh its text."""
+        cursor = self.cursors[name]
+        value = cursor['value']
+        if 'time' in name:
+            cursor['label'].set_x(value)
+            cursor['label'].set_text(f'{name}: {value:.2e}s')
+        else:
+            cursor['label'].set_y(value)
+            cursor['label'].set_text(f'{name}: {value:.3f}V')
 
     def add_cursor(self, name, value, vertical=True, color=None):
-        """Add a cursor line to the plot."""
-        # Remove existing cursor if it exists
-        if self.cursors[name]['line'] is not None:
-            self.cursors[name]['line'].remove()
-            if self.cursors[name]['label'] is not None:
-                self.cursors[name]['label'].remove()
-        
+        """Add a cursor line to the plot; color may be a name or an RGBA tuple."""
         # Use the helper to get fallback theme
         fallback_theme = self._get_fallback_theme()
+        color = color or self.current_theme.get('accent', fallback_theme['accent'])
         
-        if vertical:
-            line = self.ax.axvline(
-                value,
-                color=color or self.current_theme.get('accent', fallback_theme['accent']),
-                linestyle='--',
-                alpha=0.8,
-                picker=True,
-                label=name
-            )
-            label = self.ax.text(
-                value, 0.02,
-                f'{name}',
-                rotation=90,
-                verticalalignment='bottom',
-                color=color or self.current_theme.get('accent', fallback_theme['accent']),
-                backgroundcolor=self.current_theme.get('bg', fallback_theme['bg']),
-                alpha=0.8
-            )
-        else:
-            line = self.ax.axhline(
-                value,
-                color=color or self.current_theme.get('accent', fallback_theme['accent']),
-                linestyle='--',
-                alpha=0.8,
-                picker=True,
-                label=name
-            )
-            label = self.ax.text(
-                0.02, value,
-                f'{name}',
-                verticalalignment='bottom',
-                color=color or self.current_theme.get('accent', fallback_theme['accent']),
-                backgroundcolor=self.current_theme.get('bg', fallback_theme['bg']),
-                alpha=0.8
-            )
-        
-        self.cursors[name].update({
-            'line': line,
-            'label': label,
+        cursor = self.cursors[name]
+        cursor.update({
             'value': value,
             'active': True
         })
         
-        # Force a redraw
-        self.ax.figure.canvas.draw()
+        # Move the existing line and label into place
+        if vertical:
+            cursor['line'].set_xdata([value, value])
+        else:
+            cursor['line'].set_ydata([value, value])
+        cursor['line'].set_color(color)
+        cursor['line'].set_visible(True)
+        self._update_label(name)
+        cursor['label'].set_color(color)
+        cursor['label'].set_backgroundcolor(self.current_theme.get('bg', fallback_theme['bg']))
+        cursor['label'].set_visible(True)
+        
+        # Schedule a redraw
+        self.ax.figure.canvas.draw_idle()
         
         # Update measurements in the viewer
         if hasattr(self.viewer, 'update_measurements'):
             self.viewer.update_measurements()
 
     def remove_cursor(self, name):
-        """Remove a cursor and its label from the plot."""
-        cursor = self.cursors[name]
-        try:
-            if cursor['line'] is not None:
-                cursor['line'].remove()
-                self.ax.figure.canvas.draw()
-        except (ValueError, AttributeError):
-            pass
-            
-        try:
-            if cursor['label'] is not None:
-                cursor['label'].remove()
-                self.ax.figure.canvas.draw()
-        except (ValueError, AttributeError):
-            pass
-            
+        """Hide a cursor and its label."""
+        self._hide_cursor(self.cursors[name])
+        self.ax.figure.canvas.draw_idle()
+
+    def clear_cursors(self):
+        """Hide all cursors and their labels without redrawing."""
+        for cursor in self.cursors.values():
+            self._hide_cursor(cursor)
+
+    @staticmethod
+    def _hide_cursor(cursor):
+        cursor['line'].set_visible(False)
+        cursor['label'].set_visible(False)
         cursor.update({
-            'line': None,
-            'label': None,
             'value': None,
             'active': False
         })
 
+    def is_placed(self, name):
+        """Return whether a cursor is currently placed on the plot."""
+        return self.cursors[name]['value'] is not None
+
+    def get_active_value(self, name):
+        """Return a placed cursor's value, or None if it is not placed."""
+        return self.cursors[name]['value']
+
     def get_cursor_measurements(self):
         """Get measurements between cursors."""
         measurements = {}
@@ -132,46 +148,13 @@ class CursorManager:
         return measurements
 
     def update_cursor_positions(self):
-        """Update cursor positions and labels."""
-        # Use the helper to get fallback theme
-        fallback_theme = self._get_fallback_theme()
-        
-        for name, cursor in self.cursors.items():
-            if cursor['line'] is not None:
-                try:
-                    if cursor['label'] is not None:
-                        cursor['label'].remove()
-                        cursor['label'] = None
-                except (ValueError, AttributeError):
-                    pass
-                    
-                # Create new label
-                if 'time' in name:
-                    cursor['label'] = self.ax.text(
-                        cursor['value'],
-                        self.ax.get_ylim()[1],
-                        f'{name}: {cursor["value"]:.2e}s',
-                        rotation=90,
-                        color=cursor['line'].get_color(),
-                        va='top',
-                        ha='right',
-                        backgroundcolor=self.current_theme.get('bg', fallback_theme['bg']),
-                        alpha=0.8
-                    )
-                else:
-                    cursor['label'] = self.ax.text(
-                        self.ax.get_xlim()[0],
-                        cursor['value'],
-                        f'{name}: {cursor["value"]:.3f}V',
-                        color=cursor['line'].get_color(),
-                        va='bottom',
-                        ha='left',
-                        backgroundcolor=self.current_theme.get('bg', fallback_theme['bg']),
-                        alpha=0.8
-                    )
+        """Update cursor labels."""
+        for name in self.cursors:
+            if self.is_placed(name):
+                self._update_label(name)
         
-        # Force a redraw
-        self.ax.figure.canvas.draw()
+        # Schedule a redraw
+        self.ax.figure.canvas.draw_idle()
         
         # Update measurements in the viewer
         if hasattr(self.viewer, 'update_measurements'):
@@ -179,12 +162,12 @@ class CursorManager:
 
     def on_click(self, event):
         """Handle mouse click events for cursor dragging."""
-        if event.inaxes != self.ax or event.button != 1:  # Only handle left clicks
+        if event.xdata is None or event.button != 1:  # Only handle left clicks
             return
 
         # Check if click is near any cursor
         for name, cursor in self.cursors.items():
-            if cursor['line'] is None:
+            if cursor['value'] is None:
                 continue
 
             if 'time' in name:
@@ -206,40 +189,28 @@ class CursorManager:
                     cursor['active'] = True
                     return
 
+    def get_cursor_artists(self, name):
+        """Get the line and label artists of a cursor."""
+        cursor = self.cursors[name]
+        return [cursor['line'], cursor['label']]
+
     def on_motion(self, event):
         """Handle mouse motion events for cursor dragging."""
-        if not self.dragging or not self.active_cursor or event.inaxes != self.ax:
-            return
+        if not self.dragging or not self.active_cursor or event.xdata is None:
+            return False
 
-        plot_manager = self.ax.figure.canvas.get_tk_widget().master.master
-        cursor = self.cursors[self.active_cursor]
+        name = self.active_cursor
+        cursor = self.cursors[name]
         
-        if 'time' in self.active_cursor:
-            # Update time cursor position
+        # Move the line and label in place; the caller handles drawing and measurements
+        if 'time' in name:
             cursor['line'].set_xdata([event.xdata, event.xdata])
             cursor['value'] = event.xdata
-            # Update stored position in plot manager
-            plot_manager.cursor_positions[self.active_cursor] = event.xdata
-            # Update file-specific storage
-            if plot_manager.current_file:
-                plot_manager.file_cursor_positions[plot_manager.current_file][self.active_cursor] = event.xdata
         else:
-            # Update voltage cursor position
             cursor['line'].set_ydata([event.ydata, event.ydata])
             cursor['value'] = event.ydata
-            # Update stored position in plot manager
-            plot_manager.cursor_positions[self.active_cursor] = event.ydata
-            # Update file-specific storage
-            if plot_manager.current_file:
-                plot_manager.file_cursor_positions[plot_manager.current_file][self.active_cursor] = event.ydata
-
-        # Update cursor label
-        self.update_cursor_positions()
-        self.ax.figure.canvas.draw()
-        
-        # Update measurements in the viewer
-        if hasattr(self.viewer, 'update_measurements'):
-            self.viewer.update_measurements()
+        self._update_label(name)
+        return True
 
     def on_release(self, event):
         """Handle mouse release events for cursor dragging."""
@@ -247,7 +218,6 @@ class CursorManager:
             self.cursors[self.active_cursor]['active'] = False
             self.active_cursor = None
             self.dragging = False
-            self.ax.figure.canvas.draw()
             # Update measurements one final time
             if hasattr(self.viewer, 'update_measurements'):
-                self.viewer.update_measurements() 
\ No newline at end of file
+                self.viewer.update_measurements()
@@ -63,10 +63,9 @@ class FileBrowser(ttk.Frame):
         
         # Configure tags for icons
         if self.theme_manager:
-            theme = self.theme_manager.get_current_theme()
-            if theme:
-                self.file_tree.tag_configure('folder', foreground=theme['ui']['icon_fg'])
-                self.file_tree.tag_configure('file', foreground=theme['ui']['tree_fg'])
+            ui_theme = self.theme_manager.get_current_ui_theme()
+            if ui_theme:
+                self.restyle(ui_theme)
         
         # Bind events
         self.file_tree.bind('<<TreeviewSelect>>', self._on_file_select)
@@ -222,11 +221,11 @@ class FileBrowser(ttk.Frame):
         self.file_tree.bind('<<TreeviewSelect>>', self._on_file_select)
         self.file_tree.bind('<Double-1>', self._on_tree_double_click)
 
-    def update_theme(self):
-        """Update the theme colors for the file browser."""
-        if self.theme_manager:
-            theme = self.theme_manager.get_current_theme()
-            if theme:
-                self.file_tree.tag_configure('folder', foreground=theme['ui']['icon_fg'])
-                self.file_tree.tag_configure('file', foreground=theme['ui']['tree_fg'])
-                self.refresh_files()  # Refresh to reapply tags 
\ No newline at end of file
+    def restyle(self, ui_theme):
+        """Update the row colors for the file browser.
+
+        Existing rows keep their tags, so only the tag colors are changed and
+        the data folder is not scanned again.
+        """
+        self.file_tree.tag_configure('folder', foreground=ui_theme.icon_fg)
+        self.file_tree.tag_configure('file', foreground=ui_theme.tree_fg)
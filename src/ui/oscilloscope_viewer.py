@@ -1,44 +1,231 @@
 import os
+from contextlib import contextmanager
+from pathlib import Path
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.core.data_handler import DataHandler
 from src.ui.file_browser import FileBrowser
-from src.ui.plot_manager import PlotManager
 from src.themes.theme_manager import ThemeManager
-import logging
 
-# Configure logging
-#logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# Measurement formatters, bound once instead of parsing format specs per call
+_FMT_SECONDS = "{:.2e} s".format
+_FMT_HERTZ = "{:.2e} Hz".format
+_FMT_VOLTS = "{:.3f} V".format
+_FMT_PERCENT = "{:.1f} %".format
+
+# Cursor position readouts: (cursor name, label prefix, formatter)
+_CURSOR_FIELDS = (
+    ('time1', 'TIME1', _FMT_SECONDS),
+    ('time2', 'TIME2', _FMT_SECONDS),
+    ('volt1', 'VOLT1', _FMT_VOLTS),
+    ('volt2', 'VOLT2', _FMT_VOLTS)
+)
+
+# Automatic measurements shown per channel: (label, measurement key, formatter)
+_CHANNEL_MEASUREMENTS = (
+    ('Vpp', 'vpp', _FMT_VOLTS),
+    ('Vmax', 'vmax', _FMT_VOLTS),
+    ('Vmin', 'vmin', _FMT_VOLTS),
+    ('Freq', 'freq', _FMT_HERTZ),
+    ('Period', 'period', _FMT_SECONDS),
+    ('Rise', 'rise_time', _FMT_SECONDS),
+    ('Fall', 'fall_time', _FMT_SECONDS),
+    ('Duty', 'duty', _FMT_PERCENT)
+)
+
+def _ensure_mpl_backend():
+    """Pin matplotlib to the Tk backend so it does not probe other GUI toolkits."""
+    import matplotlib
+    matplotlib.use("TkAgg", force=True)
+
+def _ttk_theme_settings(ui_theme):
+    """Build the ttk theme settings for a UI theme."""
+    # The most frequently used colors are bound once
+    bg = ui_theme.bg
+    fg = ui_theme.fg
+    border = ui_theme.border
+    scrollbar = {
+        'configure': {
+            'background': ui_theme.scrollbar_bg,
+            'troughcolor': bg,
+            'bordercolor': border,
+            'arrowcolor': ui_theme.scrollbar_fg,
+            'relief': 'flat',
+            'width': 16  # Make scrollbars more visible
+        },
+        'map': {
+            'background': [('active', ui_theme.scrollbar_fg),
+                           ('pressed', ui_theme.scrollbar_fg)],
+            'troughcolor': [('active', bg)]
+        }
+    }
+    return {
+        # Base theme settings
+        '.': {
+            'configure': {
+                'background': bg,
+                'foreground': fg,
+                'fieldbackground': ui_theme.input_bg,
+                'selectbackground': ui_theme.select_bg,
+                'selectforeground': fg,
+                'insertcolor': fg,
+                'bordercolor': border,
+                'troughcolor': bg,
+                'relief': 'flat'
+            }
+        },
+        'TFrame': {
+            'configure': {
+                'background': bg,
+                'bordercolor': border,
+                'lightcolor': border,
+                'darkcolor': border,
+                'relief': 'flat'
+            }
+        },
+        'TLabelframe': {
+            'configure': {
+                'background': bg,
+                'foreground': fg,
+                'bordercolor': border,
+                'lightcolor': border,
+                'darkcolor': border,
+                'relief': 'groove'
+            }
+        },
+        'TLabelframe.Label': {
+            'configure': {
+                'background': bg,
+                'foreground': fg
+            }
+        },
+        'TButton': {
+            'configure': {
+                'background': ui_theme.button_bg,
+                'foreground': ui_theme.button_fg,
+                'bordercolor': border,
+                'lightcolor': border,
+                'darkcolor': border,
+                'relief': 'raised'
+            },
+            'map': {
+                'background': [('active', ui_theme.button_active_bg),
+                               ('pressed', ui_theme.button_active_bg)],
+                'foreground': [('active', ui_theme.button_active_fg),
+                               ('pressed', ui_theme.button_active_fg)],
+                'relief': [('pressed', 'sunken')]
+            }
+        },
+        'Treeview': {
+            'configure': {
+                'background': ui_theme.tree_bg,
+                'foreground': ui_theme.tree_fg,
+                'fieldbackground': ui_theme.tree_bg,
+                'selectbackground': ui_theme.tree_select_bg,
+                'selectforeground': ui_theme.tree_fg,
+                'bordercolor': border,
+                'relief': 'sunken'
+            },
+            'map': {
+                'background': [('selected', ui_theme.tree_select_bg)],
+                'foreground': [('selected', ui_theme.tree_fg)]
+            }
+        },
+        'Treeview.Heading': {
+            'configure': {
+                'background': ui_theme.button_bg,
+                'foreground': ui_theme.button_fg,
+                'relief': 'raised'
+            }
+        },
+        'TLabel': {
+            'configure': {
+                'background': ui_theme.label_bg,
+                'foreground': ui_theme.label_fg,
+                'relief': 'flat'
+            }
+        },
+        'TCheckbutton': {
+            'configure': {
+                'background': bg,
+                'foreground': fg,
+                'relief': 'flat'
+            },
+            'map': {
+                'background': [('active', bg)],
+                'foreground': [('active', fg)]
+            }
+        },
+        'TCombobox': {
+            'configure': {
+                'background': ui_theme.button_bg,
+                'foreground': ui_theme.button_fg,
+                'fieldbackground': ui_theme.input_bg,
+                'selectbackground': ui_theme.select_bg,
+                'selectforeground': fg,
+                'arrowcolor': fg,
+                'bordercolor': border,
+                'relief': 'sunken'
+            },
+            'map': {
+                'background': [('active', ui_theme.button_active_bg),
+                               ('pressed', ui_theme.button_active_bg)],
+                'foreground': [('active', ui_theme.button_active_fg),
+                               ('pressed', ui_theme.button_active_fg)]
+            }
+        },
+        'Vertical.TScrollbar': scrollbar,
+        'Horizontal.TScrollbar': scrollbar,
+        'Icon.TButton': {
+            'configure': {
+                'background': bg,
+                'foreground': ui_theme.icon_fg,
+                'bordercolor': border,
+                'relief': 'flat'
+            },
+            'map': {
+                'background': [('active', bg)],
+                'foreground': [('active', ui_theme.accent)]
+            }
+        }
+    }
 
 class OscilloscopeViewer(tk.Tk):
+    # Placeholder texts for a channel's measurement labels, built once
+    _MEAS_DEFAULTS = tuple((key, f"{key}: --") for key, _, _ in _CHANNEL_MEASUREMENTS)
+
     def __init__(self):
         super().__init__()
         
         # Initialize variables
-        self.script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.data_handler = DataHandler()
+        self.script_dir = str(Path(__file__).resolve().parents[2])
+        self._default_data_path = os.path.join(self.script_dir, "Lab3", "Data")
+        self.data_handler = None  # Created on the first file load
+        self._load_request = None  # File whose load result should be shown
         self.theme_manager = ThemeManager()
+        self._ttk_style = ttk.Style(self)
+        self.plot_manager = None
+        self._applied_theme_name = None
+        self._ttk_themes = {}  # ttk themes registered so far, by theme name
+        self._applying_theme = False  # A theme application is in progress
+        self._meas_pending = False  # A measurement update is scheduled
         
         # Configure the window
         self.title("Oscilloscope Data Viewer")
         self.geometry("1400x900")
         
-        # Force window to use light theme regardless of system settings
-        if os.system == 'darwin':  # macOS
-            self.tk.call('tk::unsupported::MacWindowStyle', 'style', self._w, 'document', 'none')
-        
-        # Set theme and style
+        # Set theme and style before any widget is built, so widgets are
+        # created against already-configured styles
         self.setup_theme()
         
         # Create main layout
         self.create_layout()
         
         # Auto-load the Lab3/Data directory if it exists
-        default_data_path = os.path.join(self.script_dir, "Lab3", "Data")
-        if os.path.exists(default_data_path):
-            self.file_browser.data_folder = default_data_path
+        if os.path.exists(self._default_data_path):
+            self.file_browser.data_folder = self._default_data_path
             self.after(100, self.file_browser.refresh_files)
-            self.set_status(f"Loading default folder: {default_data_path}")
+            self.set_status(f"Loading default folder: {self._default_data_path}")
 
     def setup_theme(self):
         """Configure the application theme and styles."""
@@ -48,234 +235,47 @@ class OscilloscopeViewer(tk.Tk):
 
     def apply_current_theme(self):
         """Apply the current theme to all widgets with comprehensive color settings."""
-        ui_theme = self.theme_manager.get_current_theme()['ui']
-        
-        # Configure root window
-        self.configure(bg=ui_theme['bg'])
-        
-        style = ttk.Style()
-        style.theme_use('default')  # Use default theme as base to avoid system theme interference
-        
-        # Configure base theme settings
-        style.configure('.',
-            background=ui_theme['bg'],
-            foreground=ui_theme['fg'],
-            fieldbackground=ui_theme['input_bg'],
-            selectbackground=ui_theme['select_bg'],
-            selectforeground=ui_theme['fg'],
-            insertcolor=ui_theme['fg'],
-            bordercolor=ui_theme['border'],
-            troughcolor=ui_theme['bg'],
-            relief='flat'
-        )
-        
-        # Frame configurations
-        style.configure('TFrame',
-            background=ui_theme['bg'],
-            bordercolor=ui_theme['border'],
-            lightcolor=ui_theme['border'],
-            darkcolor=ui_theme['border'],
-            relief='flat'
-        )
-        
-        # LabelFrame configurations
-        style.configure('TLabelframe',
-            background=ui_theme['bg'],
-            foreground=ui_theme['fg'],
-            bordercolor=ui_theme['border'],
-            lightcolor=ui_theme['border'],
-            darkcolor=ui_theme['border'],
-            relief='groove'
-        )
-        style.configure('TLabelframe.Label',
-            background=ui_theme['bg'],
-            foreground=ui_theme['fg']
-        )
-        
-        # Button configurations
-        style.configure('TButton',
-            background=ui_theme['button_bg'],
-            foreground=ui_theme['button_fg'],
-            bordercolor=ui_theme['border'],
-            lightcolor=ui_theme['border'],
-            darkcolor=ui_theme['border'],
-            relief='raised'
-        )
-        style.map('TButton',
-            background=[('active', ui_theme['button_active_bg']),
-                       ('pressed', ui_theme['button_active_bg'])],
-            foreground=[('active', ui_theme['button_active_fg']),
-                       ('pressed', ui_theme['button_active_fg'])],
-            relief=[('pressed', 'sunken')]
-        )
-        
-        # Treeview configurations
-        style.configure('Treeview',
-            background=ui_theme['tree_bg'],
-            foreground=ui_theme['tree_fg'],
-            fieldbackground=ui_theme['tree_bg'],
-            selectbackground=ui_theme['tree_select_bg'],
-            selectforeground=ui_theme['tree_fg'],
-            bordercolor=ui_theme['border'],
-            relief='sunken'
-        )
-        style.map('Treeview',
-            background=[('selected', ui_theme['tree_select_bg'])],
-            foreground=[('selected', ui_theme['tree_fg'])]
-        )
-        style.configure('Treeview.Heading',
-            background=ui_theme['button_bg'],
-            foreground=ui_theme['button_fg'],
-            relief='raised'
-        )
-        
-        # Label configurations
-        style.configure('TLabel',
-            background=ui_theme['label_bg'],
-            foreground=ui_theme['label_fg'],
-            relief='flat'
-        )
-        
-        # Checkbutton configurations
-        style.configure('TCheckbutton',
-            background=ui_theme['bg'],
-            foreground=ui_theme['fg'],
-            relief='flat'
-        )
-        style.map('TCheckbutton',
-            background=[('active', ui_theme['bg'])],
-            foreground=[('active', ui_theme['fg'])]
-        )
-        
-        # Combobox configurations
-        style.configure('TCombobox',
-            background=ui_theme['button_bg'],
-            foreground=ui_theme['button_fg'],
-            fieldbackground=ui_theme['input_bg'],
-            selectbackground=ui_theme['select_bg'],
-            selectforeground=ui_theme['fg'],
-            arrowcolor=ui_theme['fg'],
-            bordercolor=ui_theme['border'],
-            relief='sunken'
-        )
-        style.map('TCombobox',
-            background=[('active', ui_theme['button_active_bg']),
-                       ('pressed', ui_theme['button_active_bg'])],
-            foreground=[('active', ui_theme['button_active_fg']),
-                       ('pressed', ui_theme['button_active_fg'])]
-        )
-        
-        # Scrollbar configurations
-        for orient in ['Vertical', 'Horizontal']:
-            style.configure(f'{orient}.TScrollbar',
-                background=ui_theme['scrollbar_bg'],
-                troughcolor=ui_theme['bg'],
-                bordercolor=ui_theme['border'],
-                arrowcolor=ui_theme['scrollbar_fg'],
-                relief='flat',
-                width=16  # Make scrollbars more visible
-            )
-            style.map(f'{orient}.TScrollbar',
-                background=[('active', ui_theme['scrollbar_fg']),
-                           ('pressed', ui_theme['scrollbar_fg'])],
-                troughcolor=[('active', ui_theme['bg'])]
-            )
-        
-        # Icon button configurations
-        style.configure('Icon.TButton',
-            background=ui_theme['bg'],
-            foreground=ui_theme['icon_fg'],
-            bordercolor=ui_theme['border'],
-            relief='flat'
-        )
-        style.map('Icon.TButton',
-            background=[('active', ui_theme['bg'])],
-            foreground=[('active', ui_theme['accent'])]
-        )
-        
-        # Configure matplotlib navigation buttons to not use theme
-        for widget in self.winfo_children():
-            if isinstance(widget, ttk.Button):
-                if 'matplotlib' in str(widget).lower():
-                    widget.configure(style='TButton')
-                elif 'icon' in str(widget):
-                    widget.configure(style='Icon.TButton')
-        
-        # Update plot colors if plot manager exists
-        if hasattr(self, 'plot_manager'):
-            self.plot_manager.apply_theme(self.theme_manager.get_current_theme()['plot'])
-        
-        # Force redraw of all widgets
-        self.update_idletasks()
-        
-        # Recreate the layout to ensure all widgets get the new theme
-        self.after(10, self._refresh_widgets)
-
-    def _refresh_widgets(self):
-        """Force refresh all widgets to ensure theme is applied."""
-        def refresh(widget):
-            if isinstance(widget, ttk.Widget):
-                style = widget.winfo_class()
-                if style:
-                    widget.configure(style=style)
-            for child in widget.winfo_children():
-                refresh(child)
-        refresh(self)
-        self.update_idletasks()
+        theme_name = self.theme_manager.current_theme
+        if self._applying_theme or theme_name == self._applied_theme_name:
+            return
+        with self._theme_transaction():
+            theme = self.theme_manager.get_current_theme()
+            ui_theme = self.theme_manager.get_current_ui_theme()
+            plot_theme = theme['plot']
+            
+            # Configure root window
+            self.configure(bg=ui_theme.bg)
+            
+            # Each UI theme is registered once as a named ttk theme; switching
+            # themes afterwards is a single theme_use call
+            style = self._ttk_style
+            if theme_name not in self._ttk_themes:
+                # Build on the default theme to avoid system theme interference
+                style.theme_create(theme_name, parent='default',
+                                   settings=_ttk_theme_settings(ui_theme))
+            elif self._ttk_themes[theme_name] != ui_theme:
+                # Theme definition changed since it was registered
+                style.theme_settings(theme_name, _ttk_theme_settings(ui_theme))
+            self._ttk_themes[theme_name] = ui_theme
+            style.theme_use(theme_name)
+            
+            # Update plot colors if plot manager exists
+            if self.plot_manager is not None:
+                self.plot_manager.apply_theme(plot_theme)
+            
+            self._applied_theme_name = theme_name
 
-    def _update_widget_colors(self, widget, theme):
-        """Recursively update colors of all widgets."""
+    @contextmanager
+    def _theme_transaction(self):
+        """Mark a theme application in progress and flush its redraws once at the end."""
+        self._applying_theme = True
         try:
-            # Log widget update
-            logging.debug(f"Updating widget: {widget.winfo_class()}")
-
-            # Update ttk widget style
-            if isinstance(widget, ttk.Widget):
-                if isinstance(widget, ttk.Button):
-                    widget.configure(style='TButton')
-                elif isinstance(widget, ttk.Combobox):
-                    widget.configure(style='TCombobox')
-                elif isinstance(widget, ttk.Separator):
-                    widget.configure(style='Toolbar.TSeparator')
-                else:
-                    widget.configure(style=widget.winfo_class())
-            # Update tk widget colors
-            elif isinstance(widget, (tk.Label, tk.Frame, tk.LabelFrame)):
-                widget.configure(
-                    background=theme['bg'],
-                    foreground=theme['fg']
-                )
-            elif isinstance(widget, tk.Entry):
-                widget.configure(
-                    background=theme['bg'],
-                    foreground=theme['fg'],
-                    insertbackground=theme['fg'],
-                    selectbackground=theme['select_bg'],
-                    selectforeground=theme['fg']
-                )
-            elif isinstance(widget, (tk.Listbox, tk.Text)):
-                widget.configure(
-                    background=theme['bg'],
-                    foreground=theme['fg'],
-                    selectbackground=theme['select_bg'],
-                    selectforeground=theme['fg']
-                )
-            elif isinstance(widget, tk.Button):
-                widget.configure(
-                    background=theme['frame_bg'],
-                    foreground=theme['fg'],
-                    activebackground=theme['select_bg'],
-                    activeforeground=theme['fg'],
-                    highlightbackground=theme['bg'],
-                    highlightcolor=theme['fg']
-                )
-        except tk.TclError:
-            logging.error(f"Error updating widget: {widget.winfo_class()}")
-            pass
-        
-        # Recursively update all children
-        for child in widget.winfo_children():
-            self._update_widget_colors(child, theme)
+            yield
+        finally:
+            self._applying_theme = False
+        # Force redraw of all widgets; ttk widgets pick up the new theme
+        # on their own when it is selected
+        self.update_idletasks()
 
     def create_layout(self):
         """Create the main application layout."""
@@ -325,7 +325,7 @@ class OscilloscopeViewer(tk.Tk):
         # Add file browser
         self.file_browser = FileBrowser(
             self.left_panel,
-            initial_dir=os.path.join(self.script_dir, "Lab3", "Data"),
+            initial_dir=self._default_data_path,
             on_file_select=self.load_data,
             theme_manager=self.theme_manager
         )
@@ -336,17 +336,18 @@ class OscilloscopeViewer(tk.Tk):
 
     def create_right_panel(self):
         """Create the right panel with plot area."""
+        _ensure_mpl_backend()
+        
         self.right_panel = ttk.Frame(self.content_frame)
         self.right_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Add plot manager
+        # Add plot manager; imported here so matplotlib loads after the window exists
+        from src.ui.plot_manager import PlotManager
         self.plot_manager = PlotManager(self.right_panel, self)
         self.plot_manager.pack(fill=tk.BOTH, expand=True)
         
-        # Apply current theme to plot manager
-        theme = self.theme_manager.get_current_theme()
-        if theme:
-            self.plot_manager.apply_theme(theme['plot'])
+        # The styles were applied before the plot existed; theme it once now
+        self.plot_manager.apply_theme(self.theme_manager.get_current_theme()['plot'])
 
     def setup_measurements_panel(self):
         """Setup the measurements panel."""
@@ -357,40 +358,81 @@ class OscilloscopeViewer(tk.Tk):
         cursor_frame = ttk.LabelFrame(measurements_frame, text="Cursor Measurements")
         cursor_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Add cursor position readouts
-        self.cursor_pos = {
-            'time1': tk.StringVar(value="T1: --"),
-            'time2': tk.StringVar(value="T2: --"),
-            'volt1': tk.StringVar(value="V1: --"),
-            'volt2': tk.StringVar(value="V2: --")
-        }
+        # Add cursor position readouts. These labels are read-only, so they
+        # are updated directly instead of through Tcl-traced StringVars.
+        self._cursor_labels = []
+        for _, prefix, _ in _CURSOR_FIELDS:
+            label = ttk.Label(cursor_frame, text=f"{prefix}: --")
+            label.pack(fill=tk.X, padx=5, pady=2)
+            self._cursor_labels.append(label)
         
-        for var in self.cursor_pos.values():
-            ttk.Label(cursor_frame, textvariable=var).pack(fill=tk.X, padx=5, pady=2)
-        
-        self.delta_t_var = tk.StringVar(value="ΔT: --")
-        self.delta_v_var = tk.StringVar(value="ΔV: --")
-        ttk.Label(cursor_frame, textvariable=self.delta_t_var).pack(fill=tk.X, padx=5, pady=2)
-        ttk.Label(cursor_frame, textvariable=self.delta_v_var).pack(fill=tk.X, padx=5, pady=2)
+        self.delta_t_label = ttk.Label(cursor_frame, text="ΔT: --")
+        self.delta_v_label = ttk.Label(cursor_frame, text="ΔV: --")
+        self.delta_t_label.pack(fill=tk.X, padx=5, pady=2)
+        self.delta_v_label.pack(fill=tk.X, padx=5, pady=2)
         
         # Add frequency from cursor measurements
-        self.cursor_freq_var = tk.StringVar(value="1/ΔT: --")
-        ttk.Label(cursor_frame, textvariable=self.cursor_freq_var).pack(fill=tk.X, padx=5, pady=2)
+        self.cursor_freq_label = ttk.Label(cursor_frame, text="1/ΔT: --")
+        self.cursor_freq_label.pack(fill=tk.X, padx=5, pady=2)
         
         # Automatic measurements
         self.auto_frame = ttk.LabelFrame(measurements_frame, text="Automatic Measurements")
         self.auto_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Initialize empty measurements dictionary
+        # Per-channel measurement labels and frames, created on first use
         self.measurements = {}
+        self._channel_frames = {}
+        self._shown_channels = ()
+        self._last_meas = {}  # Last value shown on each readout label
+
+    def _ensure_channel_labels(self, channel):
+        """Return the measurement labels for a channel, creating them the first time."""
+        labels = self.measurements.get(channel)
+        if labels is None:
+            channel_frame = ttk.LabelFrame(self.auto_frame, text=channel)
+            labels = {}
+            for key, placeholder in self._MEAS_DEFAULTS:
+                label = ttk.Label(channel_frame, text=placeholder)
+                label.pack(fill=tk.X, padx=5, pady=2)
+                labels[key] = label
+            self._channel_frames[channel] = channel_frame
+            self.measurements[channel] = labels
+        return labels
 
     def load_data(self, filepath):
-        """Load data from a CSV file."""
+        """Load data from a CSV file.
+
+        The file is parsed on a worker thread so the window stays responsive;
+        the result is applied on the Tk thread by _apply_loaded.
+        """
+        self.set_status(f"Loading {os.path.basename(filepath)}...")
+        
+        # pandas is only imported on first use
+        if self.data_handler is None:
+            from src.core.data_handler import DataHandler
+            self.data_handler = DataHandler()
+        
+        self._load_request = filepath
+        threading.Thread(target=self._load_worker, args=(filepath,), daemon=True).start()
+
+    def _load_worker(self, filepath):
+        """Parse a file off the Tk thread and hand the result back to it."""
         try:
-            self.set_status(f"Loading {os.path.basename(filepath)}...")
-            
-            # Load data using data handler
-            data, metadata = self.data_handler.load_data(filepath)
+            data, metadata = self.data_handler.read_csv(filepath)
+        except Exception as e:
+            self.after(0, self._load_failed, filepath, e)
+        else:
+            # Compile the optional numba decimation kernel here rather than on
+            # the Tk thread during the first plot; a no-op after the first load
+            self.plot_manager.warm_up_decimation()
+            self.after(0, self._apply_loaded, filepath, data, metadata)
+
+    def _apply_loaded(self, filepath, data, metadata):
+        """Show a parsed file, unless another file was requested meanwhile."""
+        if filepath != self._load_request:
+            return
+        try:
+            self.data_handler.set_data(data, metadata)
             
             # Update window title
             self.title(f"Oscilloscope Data - {os.path.basename(filepath)} - {metadata.get('Model', 'Unknown')}")
@@ -404,93 +446,91 @@ class OscilloscopeViewer(tk.Tk):
             self.set_status(f"Successfully loaded {os.path.basename(filepath)}")
             
         except Exception as e:
-            self.set_status(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Failed to load file: {str(e)}")
+            self._load_failed(filepath, e)
+
+    def _load_failed(self, filepath, error):
+        """Report a failed file load."""
+        if filepath != self._load_request:
+            return
+        self.set_status(f"Error: {str(error)}")
+        messagebox.showerror("Error", f"Failed to load file: {str(error)}")
 
     def update_measurements(self):
+        """Schedule a measurement update, coalescing repeated requests."""
+        if self._meas_pending:
+            return
+        self._meas_pending = True
+        self.after_idle(self._flush_meas)
+
+    def _flush_meas(self):
+        """Run the pending measurement update."""
+        self._meas_pending = False
+        self._do_update_measurements()
+
+    def _do_update_measurements(self):
         """Update all measurements."""
         # Update cursor measurements
         cursor_measurements = self.plot_manager.cursor_manager.get_cursor_measurements()
         
         # Update cursor positions
-        for name in ['time1', 'time2', 'volt1', 'volt2']:
-            if name in cursor_measurements:
-                if 'time' in name:
-                    self.cursor_pos[name].set(f"TIME{name[-1]}: {cursor_measurements[name]:.2e} s")
-                else:
-                    self.cursor_pos[name].set(f"VOLT{name[-1]}: {cursor_measurements[name]:.3f} V")
-            else:
-                self.cursor_pos[name].set(f"{'TIME' if 'time' in name else 'VOLT'}{name[-1]}: --")
+        for (name, prefix, fmt), label in zip(_CURSOR_FIELDS, self._cursor_labels):
+            self._set_readout(name, label, cursor_measurements.get(name), prefix, fmt)
         
         # Update delta measurements
-        if 'delta_t' in cursor_measurements:
-            self.delta_t_var.set(f"ΔT: {cursor_measurements['delta_t']:.2e} s")
-            self.cursor_freq_var.set(f"1/ΔT: {cursor_measurements['freq']:.2e} Hz")
-        else:
-            self.delta_t_var.set("ΔT: --")
-            self.cursor_freq_var.set("1/ΔT: --")
-            
-        if 'delta_v' in cursor_measurements:
-            self.delta_v_var.set(f"ΔV: {cursor_measurements['delta_v']:.3f} V")
-        else:
-            self.delta_v_var.set("ΔV: --")
-        
-        # Clear existing measurements
-        for widget in self.auto_frame.winfo_children():
-            widget.destroy()
-        self.measurements.clear()
+        self._set_readout('delta_t', self.delta_t_label,
+                          cursor_measurements.get('delta_t'), "ΔT", _FMT_SECONDS)
+        self._set_readout('freq', self.cursor_freq_label,
+                          cursor_measurements.get('freq'), "1/ΔT", _FMT_HERTZ)
+        self._set_readout('delta_v', self.delta_v_label,
+                          cursor_measurements.get('delta_v'), "ΔV", _FMT_VOLTS)
+        
+        # Only re-pack channel panels when the set of enabled channels changes
+        active = tuple(channel for channel, enabled in self.plot_manager.channel_vars.items()
+                       if enabled.get())
+        if active != self._shown_channels:
+            for channel_frame in self._channel_frames.values():
+                channel_frame.pack_forget()
+            for channel in active:
+                self._ensure_channel_labels(channel)
+                self._channel_frames[channel].pack(fill=tk.X, padx=5, pady=5)
+            self._shown_channels = active
         
         # Update automatic measurements for each enabled channel
-        for channel in self.plot_manager.channel_vars:
-            if self.plot_manager.channel_vars[channel].get():
-                # Create a new frame for this channel's measurements
-                channel_frame = ttk.LabelFrame(self.auto_frame, text=channel)
-                channel_frame.pack(fill=tk.X, padx=5, pady=5)
-                
-                # Initialize measurements for this channel
-                self.measurements[channel] = {
-                    'Vpp': tk.StringVar(value="Vpp: --"),
-                    'Vmax': tk.StringVar(value="Vmax: --"),
-                    'Vmin': tk.StringVar(value="Vmin: --"),
-                    'Freq': tk.StringVar(value="Freq: --"),
-                    'Period': tk.StringVar(value="Period: --"),
-                    'Rise': tk.StringVar(value="Rise: --"),
-                    'Fall': tk.StringVar(value="Fall: --"),
-                    'Duty': tk.StringVar(value="Duty: --")
-                }
-                
-                # Get measurements for this channel
+        for channel in active:
+            labels = self.measurements[channel]
+            
+            # Get measurements for this channel
+            measurements = None
+            if self.data_handler is not None:
                 measurements = self.data_handler.get_measurements(channel)
-                if measurements:
-                    self.measurements[channel]['Vpp'].set(f"Vpp: {measurements['vpp']:.3f} V")
-                    self.measurements[channel]['Vmax'].set(f"Vmax: {measurements['vmax']:.3f} V")
-                    self.measurements[channel]['Vmin'].set(f"Vmin: {measurements['vmin']:.3f} V")
-                    self.measurements[channel]['Freq'].set(f"Freq: {measurements['freq']:.2e} Hz")
-                    self.measurements[channel]['Period'].set(f"Period: {measurements['period']:.2e} s")
-                    self.measurements[channel]['Rise'].set(f"Rise: {measurements['rise_time']:.2e} s")
-                    self.measurements[channel]['Fall'].set(f"Fall: {measurements['fall_time']:.2e} s")
-                    self.measurements[channel]['Duty'].set(f"Duty: {measurements['duty']:.1f} %")
-                
-                # Add labels for this channel's measurements
-                for var in self.measurements[channel].values():
-                    ttk.Label(channel_frame, textvariable=var).pack(fill=tk.X, padx=5, pady=2)
+            for key, field, fmt in _CHANNEL_MEASUREMENTS:
+                value = measurements[field] if measurements else None
+                self._set_readout((channel, key), labels[key], value, key, fmt)
+
+    def _set_readout(self, key, label, value, prefix, fmt):
+        """Show a measurement value on a label, skipping the write if it is unchanged."""
+        if key in self._last_meas and self._last_meas[key] == value:
+            return
+        self._last_meas[key] = value
+        if value is None:
+            label.configure(text=prefix + ": --")
+        else:
+            label.configure(text=prefix + ": " + fmt(value))
 
     def set_status(self, message):
         """Update status bar message."""
         self.status_bar.config(text=message)
-        self.update_idletasks()
 
     def change_theme(self):
         """Change the current theme."""
-        self.theme_manager.set_current_theme(self.theme_var.get())
+        new_theme = self.theme_var.get()
+        if new_theme == self.theme_manager.current_theme:
+            return
+        
+        # Restyles all ttk widgets, including the measurement labels; the plot
+        # is only redrawn by apply_theme when its colors actually differ
+        self.theme_manager.set_current_theme(new_theme)
         self.apply_current_theme()
         
-        # Refresh file browser and measurements panel
-        if hasattr(self, 'file_browser'):
-            self.file_browser.update_theme()
-        if hasattr(self, 'plot_manager'):
-            self.plot_manager.update_plot()
-            
-        # Update measurements if they exist
-        if hasattr(self, 'update_measurements'):
-            self.update_measurements() 
\ No newline at end of file
+        # Refresh file browser row colors
+        self.file_browser.restyle(self.theme_manager.get_current_ui_theme())
@@ -1,83 +1,57 @@
+import json
+from functools import lru_cache
+from typing import NamedTuple
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import matplotlib
-from src.ui.cursor_manager import CursorManager
+import numpy as np
 from src.themes.theme_manager import ThemeManager
 
-class ThemedNavigationToolbar(NavigationToolbar2Tk):
-    def __init__(self, canvas, window, theme):
-        super().__init__(canvas, window)
-        self.theme = theme
-        self._apply_theme()
-    
-    def _apply_theme(self):
-        """Apply theme to all toolbar elements."""
-        # Get theme colors with fallbacks
-        bg_color = self.theme['bg']
-        text_color = self.theme['text']
-        select_bg = self.theme.get('select_bg', text_color)  # fallback to text color if select_bg not defined
-        
-        # Configure the main toolbar
-        self.configure(background=bg_color)
-        
-        # Update all buttons and labels
-        for widget in self.winfo_children():
-            if isinstance(widget, (tk.Button, tk.Label)):
-                widget.configure(
-                    background=bg_color,
-                    foreground=text_color,
-                    activebackground=select_bg,
-                    activeforeground=text_color,
-                    highlightbackground=bg_color,
-                    highlightcolor=text_color
-                )
-            elif isinstance(widget, tk.Frame):
-                widget.configure(background=bg_color)
-                for child in widget.winfo_children():
-                    if isinstance(child, (tk.Button, tk.Label)):
-                        child.configure(
-                            background=bg_color,
-                            foreground=text_color,
-                            activebackground=select_bg,
-                            activeforeground=text_color,
-                            highlightbackground=bg_color,
-                            highlightcolor=text_color
-                        )
-        
-        # Update matplotlib's internal icon colors
-        matplotlib.rcParams['savefig.facecolor'] = bg_color
-        matplotlib.rcParams['figure.facecolor'] = bg_color
-        matplotlib.rcParams['axes.facecolor'] = bg_color
-        matplotlib.rcParams['axes.edgecolor'] = text_color
-        matplotlib.rcParams['axes.labelcolor'] = text_color
-        matplotlib.rcParams['xtick.color'] = text_color
-        matplotlib.rcParams['ytick.color'] = text_color
-        matplotlib.rcParams['text.color'] = text_color
+@lru_cache(maxsize=16)
+def _resolve_color(name):
+    """Resolve a color name to an RGBA tuple once."""
+    from matplotlib.colors import to_rgba
+    return to_rgba(name)
+
+class CursorState(NamedTuple):
+    """Stored cursor positions; None where a cursor is not placed."""
+    time1: float | None = None
+    time2: float | None = None
+    volt1: float | None = None
+    volt2: float | None = None
 
 class PlotManager(ttk.Frame):
     def __init__(self, parent, viewer):
-        super().__init__(parent)
+        super().__init__(parent, style='Plot.TFrame')
+        self._ttk_style = ttk.Style(self)
         self.parent = parent
         self.viewer = viewer
         # Store cursor positions per file
         self.file_cursor_positions = {}
         self.current_file = None
-        self.cursor_positions = {
-            'time1': None,
-            'time2': None,
-            'volt1': None,
-            'volt2': None
-        }
+        self.cursor_positions = CursorState()
         self.channel_vars = {}  # Dictionary to store channel variables
+        self._channel_widget_pool = {}  # Channel name -> (Checkbutton, BooleanVar), built once
         self.current_data = None  # Store current data
         self.current_metadata = None  # Store current metadata
         self.current_theme = None  # Store current theme
-        
-        # Get initial theme from parent's theme manager
-        if hasattr(self.parent.master, 'theme_manager'):
-            self.theme_manager = self.parent.master.theme_manager
+        self.current_theme_hash = None  # Hash of the last applied theme
+        self._applied_theme = None  # Theme object last passed to apply_theme
+        self._channel_lines = {}  # Plotted line per channel, reused across updates
+        self._channel_cols = ()  # Channel column names of the current data
+        self._time_arr = None  # Cached time column as a contiguous array
+        self._chan_arr = {}  # Cached channel columns as contiguous float32 arrays
+        self._decimated_key = None  # (start, stop, pixels) of the data currently on the lines
+        self._last_legend_key = None  # Visible channels the legend was built for
+        self._legend_theme_hash = None  # Theme hash the legend was last styled with
+        self._last_fp = None  # Fingerprint of the state last drawn by update_plot
+        self._plotted_channels = ()  # Visible channels the axes were last scaled to
+        self._bg = None  # Cached axes background for blitting cursor drags
+        self._blit_artists = []  # Animated artists of the cursor being dragged
+        self._pending_meas = None  # after() id of the throttled drag measurement update
+        
+        # Get initial theme from the viewer's theme manager
+        if hasattr(self.viewer, 'theme_manager'):
+            self.theme_manager = self.viewer.theme_manager
             initial_theme = self.theme_manager.get_current_theme()
             if initial_theme:
                 self.current_theme = initial_theme['plot']
@@ -88,12 +62,28 @@ class PlotManager(ttk.Frame):
             if initial_theme:
                 self.current_theme = initial_theme['plot']
         
+        # Fallback palette for anything the current theme does not provide
+        self._fallback_plot_theme = self.theme_manager.get_theme("Gruvbox Dark")['plot']
+        
         self.setup_plot()
         self.setup_controls()
 
+    @staticmethod
+    def theme_hash(theme):
+        """Return a hash identifying the contents of a plot theme."""
+        return hash(json.dumps(theme, sort_keys=True))
+
     def apply_theme(self, theme):
         """Apply theme to plot and related widgets."""
+        # The same theme object is re-applied often; skip it before hashing
+        if theme is self._applied_theme:
+            return
+        self._applied_theme = theme
+        theme_hash = self.theme_hash(theme)
+        if theme_hash == self.current_theme_hash:
+            return
         self.current_theme = theme
+        self.current_theme_hash = theme_hash
         
         # Update figure and axes colors
         self.fig.set_facecolor(theme['bg'])
@@ -108,12 +98,7 @@ class PlotManager(ttk.Frame):
         # Update labels
         self.ax.xaxis.label.set_color(theme['text'])
         self.ax.yaxis.label.set_color(theme['text'])
-        if self.ax.get_title():
-            self.ax.title.set_color(theme['text'])
-        
-        # Update legend if it exists
-        if self.ax.get_legend():
-            self.ax.legend(facecolor=theme['bg'], labelcolor=theme['text'])
+        self.ax.title.set_color(theme['text'])
         
         # Update cursor overlay
         self.cursor_overlay.configure(
@@ -124,26 +109,16 @@ class PlotManager(ttk.Frame):
         # Store channel colors for use in update_plot
         self.channel_colors = theme['channel_colors']
         
-        # Update toolbar appearance
+        # Restyle the toolbar in place
         if hasattr(self, 'toolbar'):
-            # Always recreate the toolbar to ensure proper theming
-            self.toolbar.destroy()
-            self.toolbar = ThemedNavigationToolbar(self.canvas, self, theme)
-            self.toolbar.update()
-            self.toolbar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        # Update all ttk widgets in the control panel
-        self._update_control_panel(theme)
+            self.toolbar.set_theme(theme)
         
-        # Configure the frame itself
-        style = ttk.Style()
-        style.configure('Plot.TFrame',
-                       background=theme['bg'])
-        self.configure(style='Plot.TFrame')
+        # Control panel widgets use the shared ttk styles, which the viewer's
+        # theme already configures; only the frame's own style is set here
+        self._ttk_style.configure('Plot.TFrame', background=theme['bg'])
         
-        # Force a redraw of the canvas and update
-        self.canvas.draw()
-        self.update_idletasks()
+        # Schedule a redraw of the canvas so it coalesces with other idle work
+        self.canvas.draw_idle()
         
         # Reapply theme to cursor manager
         if hasattr(self, 'cursor_manager'):
@@ -153,35 +128,27 @@ class PlotManager(ttk.Frame):
         if self.current_data is not None:
             self.update_plot()
 
-    def _update_control_panel(self, theme):
-        """Update the control panel widgets with the current theme."""
-        # Update channel checkbuttons
-        for widget in self.channel_frame.winfo_children():
-            if isinstance(widget, ttk.Checkbutton):
-                widget.configure(style='TCheckbutton')
-        
-        # Update cursor controls
-        for frame in self.winfo_children():
-            if isinstance(frame, ttk.LabelFrame):
-                frame.configure(style='TLabelframe')
-                for child in frame.winfo_children():
-                    if isinstance(child, ttk.Frame):
-                        child.configure(style='TFrame')
-                    elif isinstance(child, ttk.Label):
-                        child.configure(style='TLabel')
-                    elif isinstance(child, ttk.Checkbutton):
-                        child.configure(style='TCheckbutton')
-                    elif isinstance(child, ttk.Combobox):
-                        child.configure(style='Theme.TCombobox')
-                        
-        # Force update
-        self.update_idletasks()
-
     def setup_plot(self):
         """Setup the matplotlib plot with enhanced cursor interaction."""
+        # Import the plotting stack here so importing this module stays cheap
+        import matplotlib.style
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from src.ui.cursor_manager import CursorManager
+        from src.ui.themed_toolbar import ThemedNavigationToolbar
+        
+        # The 'fast' style lets Agg merge sub-pixel segments of the (decimated)
+        # traces and render long paths in chunks; it sets no colors
+        matplotlib.style.use('fast')
+        
         self.fig = Figure(figsize=(10, 6))
         self.ax = self.fig.add_subplot(111)
         
+        # Axis labels and the title are created once; updates only change text and colors
+        self.ax.set_xlabel('Time (s)')
+        self.ax.set_ylabel('Voltage (V)')
+        self.ax.set_title('', pad=10)
+        
         # Set initial colors from theme if available
         if self.current_theme:
             self.fig.set_facecolor(self.current_theme['bg'])
@@ -196,13 +163,14 @@ class PlotManager(ttk.Frame):
             # Update labels
             self.ax.xaxis.label.set_color(self.current_theme['text'])
             self.ax.yaxis.label.set_color(self.current_theme['text'])
+            self.ax.title.set_color(self.current_theme['text'])
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Add themed navigation toolbar
-        self.toolbar = ThemedNavigationToolbar(self.canvas, self, self.current_theme or self.theme_manager.get_theme("Gruvbox Dark")['plot'])
+        self.toolbar = ThemedNavigationToolbar(self.canvas, self, self.current_theme or self._fallback_plot_theme)
         self.toolbar.update()
         
         # Initialize cursor manager
@@ -212,10 +180,11 @@ class PlotManager(ttk.Frame):
         self.after(0, lambda: self.cursor_manager.set_theme(self.current_theme) if self.current_theme else None)
         
         # Add cursor instructions overlay
-        fallback_theme = self.theme_manager.get_theme("Gruvbox Dark")['plot']
+        fallback_theme = self._fallback_plot_theme
+        self._overlay_var = tk.StringVar(self, value="Double-click to place cursors\nDrag cursors to move them")
         self.cursor_overlay = tk.Label(
             self,
-            text="Double-click to place cursors\nDrag cursors to move them",
+            textvariable=self._overlay_var,
             justify=tk.CENTER,
             fg=self.current_theme['text'] if self.current_theme else fallback_theme['text'],
             bg=self.current_theme['bg'] if self.current_theme else fallback_theme['bg']
@@ -226,178 +195,297 @@ class PlotManager(ttk.Frame):
         self.canvas.mpl_connect('button_press_event', self.on_plot_click)
         self.canvas.mpl_connect('motion_notify_event', self.on_motion)
         self.canvas.mpl_connect('button_release_event', self.on_release)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
 
     def setup_controls(self):
         """Setup plot control panel."""
         control_frame = ttk.LabelFrame(self, text="Display Options", style='TLabelframe')
         control_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        # Channel selection frame
+        # Channel selection frame and cursor controls, laid out in one grid
         self.channel_frame = ttk.Frame(control_frame, style='TFrame')
-        self.channel_frame.pack(side=tk.LEFT, padx=5)
-        
-        # Cursor controls
+        self.channel_frame.grid(row=0, column=0, padx=5, sticky='w')
         cursor_frame = ttk.LabelFrame(control_frame, text="Cursors", style='TLabelframe')
-        cursor_frame.pack(side=tk.LEFT, fill=tk.X, padx=5)
-        
-        # Time cursors
-        time_frame = ttk.Frame(cursor_frame, style='TFrame')
-        time_frame.pack(side=tk.LEFT, padx=5)
-        
-        self.time_cursor_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            time_frame,
-            text="Time",
-            variable=self.time_cursor_var,
-            command=self.toggle_time_cursors,
-            style='TCheckbutton'
-        ).pack(side=tk.LEFT)
+        cursor_frame.grid(row=0, column=1, padx=5, sticky='ew')
         
         # Use theme accent color for cursors or fallback to Gruvbox Dark
-        fallback_theme = self.theme_manager.get_theme("Gruvbox Dark")['plot']
+        fallback_theme = self._fallback_plot_theme
         default_color = self.current_theme.get('accent', fallback_theme['accent']) if self.current_theme else fallback_theme['accent']
         
+        self.time_cursor_var = tk.BooleanVar(value=False)
         self.time_cursor_color = tk.StringVar(value=default_color)
-        time_color_combo = ttk.Combobox(
-            time_frame,
-            textvariable=self.time_cursor_color,
-            values=[default_color],  # Only use theme color
-            width=8,
-            state='readonly',
-            style='TCombobox'
-        )
-        time_color_combo.pack(side=tk.LEFT, padx=5)
-        
-        # Voltage cursors
-        volt_frame = ttk.Frame(cursor_frame, style='TFrame')
-        volt_frame.pack(side=tk.LEFT, padx=5)
-        
         self.volt_cursor_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(
-            volt_frame,
-            text="Voltage",
-            variable=self.volt_cursor_var,
-            command=self.toggle_voltage_cursors,
-            style='TCheckbutton'
-        ).pack(side=tk.LEFT)
-        
         self.volt_cursor_color = tk.StringVar(value=default_color)
-        volt_color_combo = ttk.Combobox(
-            volt_frame,
-            textvariable=self.volt_cursor_color,
-            values=[default_color],  # Only use theme color
-            width=8,
-            state='readonly',
-            style='TCombobox'
+        
+        # Time and voltage cursors: a toggle and a color picker each
+        cursor_controls = (
+            ("Time", self.time_cursor_var, self.time_cursor_color, self.toggle_time_cursors),
+            ("Voltage", self.volt_cursor_var, self.volt_cursor_color, self.toggle_voltage_cursors)
         )
-        volt_color_combo.pack(side=tk.LEFT, padx=5)
+        for i, (text, var, color_var, command) in enumerate(cursor_controls):
+            ttk.Checkbutton(
+                cursor_frame,
+                text=text,
+                variable=var,
+                command=command,
+                style='TCheckbutton'
+            ).grid(row=0, column=2 * i, padx=(5, 0))
+            ttk.Combobox(
+                cursor_frame,
+                textvariable=color_var,
+                values=[default_color],  # Only use theme color
+                width=8,
+                state='readonly',
+                style='TCombobox'
+            ).grid(row=0, column=2 * i + 1, padx=5)
 
     def update_plot(self, data=None, metadata=None, filepath=None):
         """Update the plot with new data."""
         if data is not None:
             self.current_data = data
             self.current_metadata = metadata
+            self._cache_arrays(data)
         elif self.current_data is None:
             return
+        elif self._plot_fingerprint() == self._last_fp:
+            return  # Nothing visible changed since the last update
 
         # If loading a new file, store current cursor positions for the old file
         if self.current_file is not None and self.current_file != filepath:
-            self.file_cursor_positions[self.current_file] = self.cursor_positions.copy()
+            self.file_cursor_positions[self.current_file] = self.cursor_positions
 
         # Update current file and load its cursor positions if they exist
         if filepath is not None:
             self.current_file = filepath
-            if filepath in self.file_cursor_positions:
-                self.cursor_positions = self.file_cursor_positions[filepath].copy()
-            else:
-                self.cursor_positions = {
-                    'time1': None,
-                    'time2': None,
-                    'volt1': None,
-                    'volt2': None
-                }
+            self.cursor_positions = self.file_cursor_positions.get(filepath, CursorState())
 
             # Update channel controls based on available channels in the data
             self.update_channel_controls(self.current_data)
 
-        # Clear all cursors before clearing the plot
-        for name in ['time1', 'time2', 'volt1', 'volt2']:
-            cursor = self.cursor_manager.cursors[name]
-            cursor.update({
-                'line': None,
-                'label': None,
-                'value': None,
-                'active': False
-            })
-
-        self.ax.clear()
+        # Remove all cursors; the enabled ones are restored below
+        self.cursor_manager.clear_cursors()
+        self._bg = None
         
         # Plot each available channel if enabled
         if self.current_theme:
             colors = self.current_theme['channel_colors']
         else:
-            theme = self.theme_manager.get_theme("Gruvbox Dark")
-            colors = theme['plot']['channel_colors'] if theme else ['#FFFFFF']
-            
-        for i, channel in enumerate([col for col in self.current_data.columns if col.startswith('CH')]):
-            if channel in self.channel_vars and self.channel_vars[channel].get():
-                color = colors[i % len(colors)]
-                self.ax.plot(self.current_data['TIME'], self.current_data[channel], 
-                           label=channel, color=color, linewidth=1)
+            colors = self._fallback_plot_theme['channel_colors']
+        
+        channels = self._channel_cols
+        
+        # Drop lines of channels that are not in the current data
+        for channel in list(self._channel_lines):
+            if channel not in channels:
+                self._channel_lines.pop(channel).remove()
+        
+        # Reuse one line per channel instead of clearing and replotting the axes
+        for i, channel in enumerate(channels):
+            line = self._channel_lines.get(channel)
+            if line is None:
+                line, = self.ax.plot([], [], label=channel, linewidth=1)
+                self._channel_lines[channel] = line
+            line.set_color(colors[i % len(colors)])
+            line.set_visible(channel in self.channel_vars and self.channel_vars[channel].get())
+        
+        # Only new data or a different set of visible channels resets the view;
+        # theme and cursor refreshes keep the current zoom and line data
+        visible_lines = [line for line in self._channel_lines.values() if line.get_visible()]
+        visible = tuple(line.get_label() for line in visible_lines)
+        if data is not None or visible != self._plotted_channels:
+            self._rescale(visible)
+        if data is not None:
+            # Forget the previous file's zoom history so Home returns to this capture
+            self.toolbar.update()
 
-        # Apply current theme if it exists
+        # Axes colors and labels survive between updates; only refresh legend and title
         if self.current_theme:
-            self.fig.set_facecolor(self.current_theme['bg'])
-            self.ax.set_facecolor(self.current_theme['bg'])
-            self.ax.grid(True, color=self.current_theme['grid'], linestyle='--', alpha=0.5)
-            self.ax.tick_params(colors=self.current_theme['text'])
-            
-            for spine in self.ax.spines.values():
-                spine.set_color(self.current_theme['text'])
-
-            self.ax.set_xlabel(
-                'Time (s)',
-                color=self.current_theme['text']
-            )
-            self.ax.set_ylabel(
-                'Voltage (V)',
-                color=self.current_theme['text']
-            )
-            self.ax.legend(
-                facecolor=self.current_theme['bg'],
-                labelcolor=self.current_theme['text']
-            )
+            self._update_legend(visible_lines, visible)
             
             if self.current_metadata:
-                title = f"Time Scale: {self.current_metadata.get('Horizontal Scale', 'Unknown')}s/div"
-                self.ax.set_title(title, color=self.current_theme['text'], pad=10)
+                self.ax.title.set_text(f"Time Scale: {self.current_metadata.get('Horizontal Scale', 'Unknown')}s/div")
 
         # Restore cursors if they were enabled
         if self.time_cursor_var.get():
-            if self.cursor_positions['time1'] is not None:
-                self.cursor_manager.add_cursor('time1', self.cursor_positions['time1'], color=self.time_cursor_color.get())
-                if self.cursor_positions['time2'] is not None:
-                    self.cursor_manager.add_cursor('time2', self.cursor_positions['time2'], color=self.time_cursor_color.get())
+            if self.cursor_positions.time1 is not None:
+                self.cursor_manager.add_cursor('time1', self.cursor_positions.time1, color=_resolve_color(self.time_cursor_color.get()))
+                if self.cursor_positions.time2 is not None:
+                    self.cursor_manager.add_cursor('time2', self.cursor_positions.time2, color=_resolve_color(self.time_cursor_color.get()))
 
         if self.volt_cursor_var.get():
-            if self.cursor_positions['volt1'] is not None:
-                self.cursor_manager.add_cursor('volt1', self.cursor_positions['volt1'], vertical=False, color=self.volt_cursor_color.get())
-                if self.cursor_positions['volt2'] is not None:
-                    self.cursor_manager.add_cursor('volt2', self.cursor_positions['volt2'], vertical=False, color=self.volt_cursor_color.get())
+            if self.cursor_positions.volt1 is not None:
+                self.cursor_manager.add_cursor('volt1', self.cursor_positions.volt1, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
+                if self.cursor_positions.volt2 is not None:
+                    self.cursor_manager.add_cursor('volt2', self.cursor_positions.volt2, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
             
         # After restoring cursors, update measurements
-        if hasattr(self.parent.master, 'update_measurements'):
-            self.parent.master.update_measurements()
-        self.canvas.draw()
+        self._schedule_measure()
+        self._last_fp = self._plot_fingerprint()
+        self.canvas.draw_idle()
+
+    def _rescale(self, visible):
+        """Decimate the full capture for the visible channels and rescale the axes to it."""
+        self._plotted_channels = visible
+        
+        # Zooming afterwards re-decimates the visible window
+        self._decimated_key = None
+        self._set_line_data(0, len(self._time_arr))
+        self.ax.relim(visible_only=True)
+        # Toolbar zoom and pan turn autoscaling off; turn it back on for the new extent
+        self.ax.set_autoscale_on(True)
+        self.ax.autoscale_view()
+
+    def _update_legend(self, visible_lines, visible):
+        """Rebuild the legend when the visible channels change, else restyle it on theme changes."""
+        legend = self.ax.get_legend()
+        if visible != self._last_legend_key:
+            self._last_legend_key = visible
+            self._legend_theme_hash = self.current_theme_hash
+            if visible_lines:
+                self.ax.legend(
+                    handles=visible_lines,
+                    facecolor=self.current_theme['bg'],
+                    labelcolor=self.current_theme['text']
+                )
+            elif legend:
+                legend.remove()
+        elif legend and self._legend_theme_hash != self.current_theme_hash:
+            # Restyle the existing legend for the new theme
+            self._legend_theme_hash = self.current_theme_hash
+            legend.get_frame().set_facecolor(self.current_theme['bg'])
+            for text in legend.get_texts():
+                text.set_color(self.current_theme['text'])
+            for legend_line, line in zip(legend.get_lines(), visible_lines):
+                legend_line.set_color(line.get_color())
+
+    def _toggle_channel(self, channel):
+        """Show or hide one channel's trace without running the full plot update."""
+        line = self._channel_lines.get(channel)
+        if line is None:
+            return
+        line.set_visible(self.channel_vars[channel].get())
+        
+        visible_lines = [line for line in self._channel_lines.values() if line.get_visible()]
+        visible = tuple(line.get_label() for line in visible_lines)
+        self._rescale(visible)
+        if self.current_theme:
+            self._update_legend(visible_lines, visible)
+        
+        self._last_fp = self._plot_fingerprint()
+        self._schedule_measure()
+        self.canvas.draw_idle()
+
+    def _plot_fingerprint(self):
+        """Return a fingerprint of everything update_plot draws."""
+        return (
+            self.current_file,
+            frozenset(channel for channel, var in self.channel_vars.items() if var.get()),
+            self.time_cursor_var.get(),
+            self.volt_cursor_var.get(),
+            self.cursor_positions,
+            self.current_theme_hash
+        )
+
+    def _cache_arrays(self, data):
+        """Cache the time and channel columns of new data as contiguous arrays."""
+        # Time stays float64, so a float64 column is used as a view without copying;
+        # float32 cannot resolve sample steps at deep zoom
+        self._time_arr = np.ascontiguousarray(data['TIME'].to_numpy(dtype=np.float64, copy=False))
+        self._channel_cols = tuple(col for col in data.columns if col.startswith('CH'))
+        self._chan_arr = {
+            col: np.ascontiguousarray(data[col].to_numpy(dtype=np.float32))
+            for col in self._channel_cols
+        }
+
+    def warm_up_decimation(self):
+        """Compile the optional numba decimation kernel; meant to run off the Tk thread."""
+        from src.ui import _decimate_numba
+        try:
+            _decimate_numba.warm_up()
+        except Exception:
+            # numba is installed but cannot compile here; decimate with NumPy instead
+            _decimate_numba.minmax_bins = None
+
+    @staticmethod
+    def _decimate(t, y, n_pixels):
+        """Reduce a trace to the min and max sample of each pixel column."""
+        from src.ui._decimate_numba import minmax_bins
+        
+        # Below a few samples per pixel column the plain trace is as cheap to draw
+        n = len(y)
+        if n <= 4 * n_pixels:
+            return t, y
+        
+        if minmax_bins is not None:
+            edges = np.linspace(0, n, n_pixels + 1).astype(np.int64)
+            imin = np.empty(n_pixels, dtype=np.int64)
+            imax = np.empty(n_pixels, dtype=np.int64)
+            minmax_bins(y, edges, imin, imax)
+        else:
+            bin_size = n // n_pixels
+            n_full = bin_size * n_pixels
+            bins = y[:n_full].reshape(n_pixels, bin_size)
+            offsets = np.arange(0, n_full, bin_size)
+            imin = bins.argmin(axis=1) + offsets
+            imax = bins.argmax(axis=1) + offsets
+            
+            # Fold the remainder into the last bin
+            if n_full < n:
+                tail_min = n_full + int(y[n_full:].argmin())
+                tail_max = n_full + int(y[n_full:].argmax())
+                if y[tail_min] < y[imin[-1]]:
+                    imin[-1] = tail_min
+                if y[tail_max] > y[imax[-1]]:
+                    imax[-1] = tail_max
+        
+        # Keep each min/max pair in time order
+        idx = np.column_stack((np.minimum(imin, imax), np.maximum(imin, imax))).ravel()
+        return t[idx], y[idx]
+
+    def _set_line_data(self, start, stop):
+        """Set the decimated samples in [start, stop) on the visible channel lines."""
+        n_pixels = max(int(self.ax.bbox.width), 1)
+        key = (start, stop, n_pixels)
+        if key == self._decimated_key:
+            return
+        self._decimated_key = key
+        
+        time = self._time_arr[start:stop]
+        for channel, line in self._channel_lines.items():
+            if line.get_visible():
+                line.set_data(*self._decimate(time, self._chan_arr[channel][start:stop], n_pixels))
+            else:
+                line.set_data([], [])
+
+    def _on_xlim_changed(self, ax):
+        """Re-decimate the traces for the new visible time window."""
+        if self._time_arr is None or not self._channel_lines:
+            return
+        x0, x1 = sorted(ax.get_xlim())
+        start = max(int(np.searchsorted(self._time_arr, x0)) - 1, 0)
+        stop = min(int(np.searchsorted(self._time_arr, x1)) + 1, len(self._time_arr))
+        self._set_line_data(start, stop)
+
+    def _on_resize(self, event):
+        """Match the decimation to the new axes width and drop the blit background."""
+        self._invalidate_background()
+        self._on_xlim_changed(self.ax)
+
+    def _schedule_measure(self):
+        """Request a measurement update; the viewer coalesces requests into one per idle tick."""
+        if hasattr(self.viewer, 'update_measurements'):
+            self.viewer.update_measurements()
 
     def toggle_time_cursors(self):
         """Toggle time cursors."""
         if not self.time_cursor_var.get():
             # Store cursor positions before removing
             for name in ['time1', 'time2']:
-                cursor = self.cursor_manager.cursors[name]
-                if cursor['line'] is not None:
-                    self.cursor_positions[name] = cursor['value']
+                value = self.cursor_manager.get_active_value(name)
+                if value is not None:
+                    self.cursor_positions = self.cursor_positions._replace(**{name: value})
             # Disable time cursors
             self.cursor_manager.remove_cursor('time1')
             self.cursor_manager.remove_cursor('time2')
@@ -405,39 +493,38 @@ class PlotManager(ttk.Frame):
                 # Switch to voltage mode if voltage cursors are enabled
                 if self.volt_cursor_var.get():
                     self.cursor_manager.cursor_placement_mode = 'voltage'
-                    self.cursor_overlay.config(text="Double-click to place Voltage Cursor 1")
+                    self._overlay_var.set("Double-click to place Voltage Cursor 1")
                 else:
                     self.cursor_manager.cursor_placement_mode = None
                     self.cursor_manager.last_cursor_click = None
-                    self.cursor_overlay.config(text="Double-click to place cursors")
+                    self._overlay_var.set("Double-click to place cursors")
         else:
             # Enable time cursors and restore positions if they exist
-            if self.cursor_positions['time1'] is not None:
-                self.cursor_manager.add_cursor('time1', self.cursor_positions['time1'], color=self.time_cursor_color.get())
-                if self.cursor_positions['time2'] is not None:
-                    self.cursor_manager.add_cursor('time2', self.cursor_positions['time2'], color=self.time_cursor_color.get())
+            if self.cursor_positions.time1 is not None:
+                self.cursor_manager.add_cursor('time1', self.cursor_positions.time1, color=_resolve_color(self.time_cursor_color.get()))
+                if self.cursor_positions.time2 is not None:
+                    self.cursor_manager.add_cursor('time2', self.cursor_positions.time2, color=_resolve_color(self.time_cursor_color.get()))
                     self.cursor_manager.cursor_placement_mode = None
-                    self.cursor_overlay.config(text="Double-click to place cursors")
+                    self._overlay_var.set("Double-click to place cursors")
                 else:
                     self.cursor_manager.cursor_placement_mode = 'time'
                     self.cursor_manager.last_cursor_click = 'time1'
-                    self.cursor_overlay.config(text="Double-click to place Time Cursor 2")
+                    self._overlay_var.set("Double-click to place Time Cursor 2")
             else:
                 self.cursor_manager.cursor_placement_mode = 'time'
                 self.cursor_manager.last_cursor_click = None
-                self.cursor_overlay.config(text="Double-click to place Time Cursor 1")
-        if hasattr(self.parent.master, 'update_measurements'):
-            self.parent.master.update_measurements()
-        self.canvas.draw()
+                self._overlay_var.set("Double-click to place Time Cursor 1")
+        self._schedule_measure()
+        self.canvas.draw_idle()
 
     def toggle_voltage_cursors(self):
         """Toggle voltage cursors."""
         if not self.volt_cursor_var.get():
             # Store cursor positions before removing
             for name in ['volt1', 'volt2']:
-                cursor = self.cursor_manager.cursors[name]
-                if cursor['line'] is not None:
-                    self.cursor_positions[name] = cursor['value']
+                value = self.cursor_manager.get_active_value(name)
+                if value is not None:
+                    self.cursor_positions = self.cursor_positions._replace(**{name: value})
             # Disable voltage cursors
             self.cursor_manager.remove_cursor('volt1')
             self.cursor_manager.remove_cursor('volt2')
@@ -445,34 +532,33 @@ class PlotManager(ttk.Frame):
                 # Switch to time mode if time cursors are enabled
                 if self.time_cursor_var.get():
                     self.cursor_manager.cursor_placement_mode = 'time'
-                    self.cursor_overlay.config(text="Double-click to place Time Cursor 1")
+                    self._overlay_var.set("Double-click to place Time Cursor 1")
                 else:
                     self.cursor_manager.cursor_placement_mode = None
                     self.cursor_manager.last_cursor_click = None
-                    self.cursor_overlay.config(text="Double-click to place cursors")
+                    self._overlay_var.set("Double-click to place cursors")
         else:
             # Enable voltage cursors and restore positions if they exist
-            if self.cursor_positions['volt1'] is not None:
-                self.cursor_manager.add_cursor('volt1', self.cursor_positions['volt1'], vertical=False, color=self.volt_cursor_color.get())
-                if self.cursor_positions['volt2'] is not None:
-                    self.cursor_manager.add_cursor('volt2', self.cursor_positions['volt2'], vertical=False, color=self.volt_cursor_color.get())
+            if self.cursor_positions.volt1 is not None:
+                self.cursor_manager.add_cursor('volt1', self.cursor_positions.volt1, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
+                if self.cursor_positions.volt2 is not None:
+                    self.cursor_manager.add_cursor('volt2', self.cursor_positions.volt2, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
                     self.cursor_manager.cursor_placement_mode = None
-                    self.cursor_overlay.config(text="Double-click to place cursors")
+                    self._overlay_var.set("Double-click to place cursors")
                 else:
                     self.cursor_manager.cursor_placement_mode = 'voltage'
                     self.cursor_manager.last_cursor_click = 'volt1'
-                    self.cursor_overlay.config(text="Double-click to place Voltage Cursor 2")
+                    self._overlay_var.set("Double-click to place Voltage Cursor 2")
             else:
                 self.cursor_manager.cursor_placement_mode = 'voltage'
                 self.cursor_manager.last_cursor_click = None
-                self.cursor_overlay.config(text="Double-click to place Voltage Cursor 1")
-        if hasattr(self.parent.master, 'update_measurements'):
-            self.parent.master.update_measurements()
-        self.canvas.draw()
+                self._overlay_var.set("Double-click to place Voltage Cursor 1")
+        self._schedule_measure()
+        self.canvas.draw_idle()
 
     def on_plot_click(self, event):
         """Handle mouse clicks on the plot."""
-        if event.inaxes != self.ax or self.toolbar.mode != "":
+        if event.xdata is None or self.toolbar.mode != "":
             return
             
         if event.button == 1 and event.dblclick:  # Check for left double-click
@@ -488,6 +574,45 @@ class PlotManager(ttk.Frame):
                 self._handle_voltage_cursor_placement(event)
         elif event.button == 1:  # Single left-click
             self.cursor_manager.on_click(event)
+            if self.cursor_manager.dragging:
+                self._start_blit()
+
+    def _start_blit(self):
+        """Animate the dragged cursor and cache the background behind it."""
+        self._blit_artists = self.cursor_manager.get_cursor_artists(self.cursor_manager.active_cursor)
+        for artist in self._blit_artists:
+            artist.set_animated(True)
+        self.canvas.draw()  # _on_draw captures the background
+
+    def _stop_blit(self):
+        """Return the dragged cursor to normal drawing and drop the cached background."""
+        for artist in self._blit_artists:
+            artist.set_animated(False)
+        self._blit_artists = []
+        self._bg = None
+
+    def _on_draw(self, event):
+        """Recapture the blit background after any full draw during a drag."""
+        if not self._blit_artists:
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        # Animated artists are skipped by full draws; put the dragged cursor back
+        for artist in self._blit_artists:
+            self.ax.draw_artist(artist)
+
+    def _invalidate_background(self, event=None):
+        """Drop the cached background so the next drag motion captures a fresh one."""
+        self._bg = None
+
+    def _nearest_sample(self, x):
+        """Return the index of the sample closest to time x, or None without data."""
+        t = self._time_arr
+        if t is None or len(t) == 0:
+            return None
+        i = int(np.searchsorted(t, x))
+        if i > 0 and (i == len(t) or abs(t[i - 1] - x) < abs(t[i] - x)):
+            i -= 1
+        return i
 
     def _handle_time_cursor_placement(self, event):
         """Handle time cursor placement."""
@@ -495,22 +620,25 @@ class PlotManager(ttk.Frame):
             self.cursor_manager.cursor_placement_mode = 'time'
             self.cursor_manager.last_cursor_click = None
             
+        # Snap to the nearest sample
+        index = self._nearest_sample(event.xdata)
+        x = float(self._time_arr[index]) if index is not None else event.xdata
+            
         if self.cursor_manager.last_cursor_click is None:
-            self.cursor_manager.add_cursor('time1', event.xdata, color=self.time_cursor_color.get())
-            self.cursor_positions['time1'] = event.xdata
+            self.cursor_manager.add_cursor('time1', x, color=_resolve_color(self.time_cursor_color.get()))
+            self.cursor_positions = self.cursor_positions._replace(time1=x)
             self.cursor_manager.last_cursor_click = 'time1'
-            self.cursor_overlay.config(text="Double-click to place Time Cursor 2")
+            self._overlay_var.set("Double-click to place Time Cursor 2")
         else:
-            self.cursor_manager.add_cursor('time2', event.xdata, color=self.time_cursor_color.get())
-            self.cursor_positions['time2'] = event.xdata
+            self.cursor_manager.add_cursor('time2', x, color=_resolve_color(self.time_cursor_color.get()))
+            self.cursor_positions = self.cursor_positions._replace(time2=x)
             self.cursor_manager.cursor_placement_mode = None
             self.cursor_manager.last_cursor_click = None
-            self.cursor_overlay.config(text="Double-click to place cursors")
+            self._overlay_var.set("Double-click to place cursors")
         
-        # Force update measurements
-        if hasattr(self.parent.master, 'update_measurements'):
-            self.parent.master.update_measurements()
-        self.canvas.draw()
+        # Update measurements
+        self._schedule_measure()
+        self.canvas.draw_idle()
 
     def _handle_voltage_cursor_placement(self, event):
         """Handle voltage cursor placement."""
@@ -519,51 +647,88 @@ class PlotManager(ttk.Frame):
             self.cursor_manager.last_cursor_click = None
             
         if self.cursor_manager.last_cursor_click is None:
-            self.cursor_manager.add_cursor('volt1', event.ydata, vertical=False, color=self.volt_cursor_color.get())
-            self.cursor_positions['volt1'] = event.ydata
+            self.cursor_manager.add_cursor('volt1', event.ydata, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
+            self.cursor_positions = self.cursor_positions._replace(volt1=event.ydata)
             self.cursor_manager.last_cursor_click = 'volt1'
-            self.cursor_overlay.config(text="Double-click to place Voltage Cursor 2")
+            self._overlay_var.set("Double-click to place Voltage Cursor 2")
         else:
-            self.cursor_manager.add_cursor('volt2', event.ydata, vertical=False, color=self.volt_cursor_color.get())
-            self.cursor_positions['volt2'] = event.ydata
+            self.cursor_manager.add_cursor('volt2', event.ydata, vertical=False, color=_resolve_color(self.volt_cursor_color.get()))
+            self.cursor_positions = self.cursor_positions._replace(volt2=event.ydata)
             self.cursor_manager.cursor_placement_mode = None
             self.cursor_manager.last_cursor_click = None
-            self.cursor_overlay.config(text="Double-click to place cursors")
+            self._overlay_var.set("Double-click to place cursors")
         
-        # Force update measurements
-        if hasattr(self.parent.master, 'update_measurements'):
-            self.parent.master.update_measurements()
-        self.canvas.draw()
+        # Update measurements
+        self._schedule_measure()
+        self.canvas.draw_idle()
 
     def on_motion(self, event):
         """Handle mouse motion for cursor dragging."""
-        self.cursor_manager.on_motion(event)
-        if self.cursor_manager.dragging and hasattr(self.parent.master, 'update_measurements'):  # Only update measurements if actually dragging
-            self.parent.master.update_measurements()
+        # Plain hovering is the common case; skip it before any cursor work
+        if not self.cursor_manager.dragging or not self.cursor_manager.on_motion(event):
+            return
+        
+        name = self.cursor_manager.active_cursor
+        self.cursor_positions = self.cursor_positions._replace(**{name: self.cursor_manager.cursors[name]['value']})
+        
+        # Blit only the dragged cursor over the cached background
+        if self._bg is None:
+            self._start_blit()
+        self.canvas.restore_region(self._bg)
+        for artist in self._blit_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+        
+        # Throttle measurement updates to about one per frame while dragging
+        if self._pending_meas is None:
+            self._pending_meas = self.after(16, self._flush_meas)
+
+    def _flush_meas(self):
+        """Run the throttled drag measurement update."""
+        self._pending_meas = None
+        self._schedule_measure()
 
     def on_release(self, event):
         """Handle mouse release."""
         was_dragging = self.cursor_manager.dragging
         self.cursor_manager.on_release(event)
-        if was_dragging and hasattr(self.parent.master, 'update_measurements'):  # Update measurements after drag ends
-            self.parent.master.update_measurements()
+        if was_dragging:
+            if self._pending_meas is not None:
+                self.after_cancel(self._pending_meas)
+                self._pending_meas = None
+            self._stop_blit()
+            self.canvas.draw_idle()
+            self._schedule_measure()  # Update measurements after drag ends
 
     def update_channel_controls(self, data):
         """Update channel controls based on available channels in the data."""
-        # Clear existing channel controls
-        for widget in self.channel_frame.winfo_children():
-            widget.destroy()
+        present = self._channel_cols
+        previous = self.channel_vars
         
-        # Clear existing channel variables
-        self.channel_vars.clear()
+        # Same channel layout as the last file: keep the controls and the user's choices.
+        # channel_vars is rebuilt below in packing order, so its keys match the on-screen order
+        if present == tuple(previous):
+            return
         
-        # Create new channel controls for each channel in the data
-        for channel in [col for col in data.columns if col.startswith('CH')]:
-            self.channel_vars[channel] = tk.BooleanVar(value=True)
-            ttk.Checkbutton(
-                self.channel_frame,
-                text=channel,
-                variable=self.channel_vars[channel],
-                command=lambda ch=channel: self.update_plot(),
-                style='TCheckbutton'
-            ).pack(side=tk.LEFT, padx=2) 
\ No newline at end of file
+        # Unpack every pooled control; repacking a still-packed widget would not move it
+        for widget, _ in self._channel_widget_pool.values():
+            widget.pack_forget()
+        
+        # Pack a control for each channel in data order, creating it the first time it is seen
+        self.channel_vars = {}
+        for channel in present:
+            if channel not in self._channel_widget_pool:
+                var = tk.BooleanVar(value=True)
+                widget = ttk.Checkbutton(
+                    self.channel_frame,
+                    text=channel,
+                    variable=var,
+                    command=lambda ch=channel: self._toggle_channel(ch),
+                    style='TCheckbutton'
+                )
+                self._channel_widget_pool[channel] = (widget, var)
+            widget, var = self._channel_widget_pool[channel]
+            if channel not in previous:
+                var.set(True)  # Channels new to the layout start enabled
+            widget.pack(side=tk.LEFT, padx=2)
+            self.channel_vars[channel] = var
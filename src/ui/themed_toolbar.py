@@ -0,0 +1,69 @@
+import tkinter as tk
+from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+import matplotlib
+
+class ThemedNavigationToolbar(NavigationToolbar2Tk):
+    def __init__(self, canvas, window, theme):
+        super().__init__(canvas, window)
+        
+        # Collect the widgets to theme once; the toolbar never adds more
+        self._themed_frames = []
+        self._themed_widgets = []
+        for widget in self.winfo_children():
+            if isinstance(widget, (tk.Button, tk.Label)):
+                self._themed_widgets.append(widget)
+            elif isinstance(widget, tk.Frame):
+                self._themed_frames.append(widget)
+                self._themed_widgets.extend(
+                    child for child in widget.winfo_children()
+                    if isinstance(child, (tk.Button, tk.Label))
+                )
+        
+        self.theme = theme
+        self._apply_theme()
+    
+    def set_theme(self, theme):
+        """Restyle the existing toolbar widgets for a new theme."""
+        self.theme = theme
+        self._apply_theme()
+        
+        # Icons are rendered against the button colors, so render them again;
+        # _set_image_for_button is private to matplotlib, so skip this if it is gone
+        if not hasattr(NavigationToolbar2Tk, '_set_image_for_button'):
+            return
+        for widget in self._themed_widgets:
+            if getattr(widget, '_image_file', None) is not None:
+                NavigationToolbar2Tk._set_image_for_button(self, widget)
+    
+    def _apply_theme(self):
+        """Apply theme to all toolbar elements."""
+        # Get theme colors with fallbacks
+        bg_color = self.theme['bg']
+        text_color = self.theme['text']
+        select_bg = self.theme.get('select_bg', text_color)  # fallback to text color if select_bg not defined
+        
+        # Configure the main toolbar
+        self.configure(background=bg_color)
+        
+        # Update all buttons and labels
+        for frame in self._themed_frames:
+            frame.configure(background=bg_color)
+        for widget in self._themed_widgets:
+            widget.configure(
+                background=bg_color,
+                foreground=text_color,
+                activebackground=select_bg,
+                activeforeground=text_color,
+                highlightbackground=bg_color,
+                highlightcolor=text_color
+            )
+        
+        # Update matplotlib's internal icon colors
+        matplotlib.rcParams['savefig.facecolor'] = bg_color
+        matplotlib.rcParams['figure.facecolor'] = bg_color
+        matplotlib.rcParams['axes.facecolor'] = bg_color
+        matplotlib.rcParams['axes.edgecolor'] = text_color
+        matplotlib.rcParams['axes.labelcolor'] = text_color
+        matplotlib.rcParams['xtick.color'] = text_color
+        matplotlib.rcParams['ytick.color'] = text_color
+        matplotlib.rcParams['text.color'] = text_color